@@ -9,6 +9,9 @@ from smart_steps_ai.working_components.provider.mock import MockProvider
 from smart_steps_ai.working_components.provider.jane_mock import JaneMockProvider
 from smart_steps_ai.working_components.provider.message import Message, MessageRole
 
+# Commands that end the conversation
+EXIT_COMMANDS = frozenset({"exit", "quit", "bye"})
+
 def main():
     parser = argparse.ArgumentParser(description="CLI Chat with Mock Personas")
     parser.add_argument("--persona", choices=["mock", "jane"], default="jane", help="Persona to chat with")
@@ -51,7 +54,7 @@ def main():
         user_input = input("You: ")
         
         # Check for exit commands
-        if user_input.lower() in ["exit", "quit", "bye"]:
+        if user_input.lower() in EXIT_COMMANDS:
             print(f"\n{persona_name}: Goodbye! Take care.")
             break
         
@@ -2,9 +2,25 @@
 __init__.py for provider module
 """
 
+import importlib
+
 from .interface import AIProvider, ProviderConfig, ProviderResponse, MessageFormat
 from .mock import MockProvider
-from .jane_mock import JaneMockProvider
+
+# Providers with heavy dependencies are imported on first access
+_LAZY_IMPORTS = {
+    "JaneMockProvider": ".jane_mock",
+}
+
+def __getattr__(name):
+    """Import lazily loaded providers on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "AIProvider",
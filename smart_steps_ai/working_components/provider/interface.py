@@ -3,6 +3,16 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 
+# Role mapping used by AIProvider.transform_role
+ROLE_MAPPING = {
+    "system": "system",
+    "user": "user",
+    "client": "user",
+    "assistant": "assistant",
+    "ai": "assistant",
+    "internal": "system",
+}
+
 class MessageFormat:
     """Message format constants."""
     
@@ -117,16 +127,7 @@ class AIProvider(ABC):
         Returns:
             str: Transformed role
         """
-        role_mapping = {
-            "system": "system",
-            "user": "user",
-            "client": "user",
-            "assistant": "assistant",
-            "ai": "assistant",
-            "internal": "system",
-        }
-        
-        return role_mapping.get(role.lower(), "user")
+        return ROLE_MAPPING.get(role.lower(), "user")
     
     @abstractmethod
     def validate_api_key(self) -> bool:
@@ -42,9 +42,9 @@ class JaneMockProvider(MockProvider):
         
         try:
             self.memory_store = MemoryStore(memory_store_path)
-            logger.info(f"Initialized memory store at {memory_store_path}")
+            logger.info("Initialized memory store at %s", memory_store_path)
         except Exception as e:
-            logger.error(f"Failed to initialize memory store: {e}")
+            logger.error("Failed to initialize memory store: %s", e)
             self.memory_store = None
         
         # Add Jane-specific response templates as a fallback
@@ -136,7 +136,8 @@ class JaneMockProvider(MockProvider):
         response_content += random.choice(redirections)
         
         # Simulate processing time
-        time.sleep(0.5)
+        if self.simulated_delay > 0:
+            time.sleep(self.simulated_delay)
         
         # Create provider response
         result = ProviderResponse(
@@ -167,17 +168,17 @@ class JaneMockProvider(MockProvider):
             
             # If no memories found, log and return None
             if not memories:
-                logger.info(f"memory.miss: No relevant memories for query '{query}'")
+                logger.info("memory.miss: No relevant memories for query '%s'", query)
                 return None
             
             # Use the most relevant memory's content
             memory = memories[0]
-            logger.info(f"memory.hit: Found memory '{memory.id}' for query '{query}'")
+            logger.info("memory.hit: Found memory '%s' for query '%s'", memory.id, query)
             
             return memory.content
             
         except Exception as e:
-            logger.error(f"Error retrieving memories: {e}")
+            logger.error("Error retrieving memories: %s", e)
             return None
     
     def _get_template_response(self, query: str) -> Optional[str]:
@@ -35,6 +35,11 @@ COMMIT_CATEGORIES = {
     "test": None,  # Skip test changes
     "chore": None,  # Skip chores
 }
+CONVENTIONAL_COMMIT_PATTERN = re.compile(r"^(\w+)(?:\([\w-]+\))?: (.+)$")
+MANUAL_CATEGORY_PATTERN = re.compile(r"^\[(\w+)\] (.+)$")
+CHANGELOG_HEADER_PATTERN = re.compile(
+    r"(# Changelog.*?adheres to \[Semantic Versioning\].*?\n\n)", re.DOTALL
+)
 
 
 class ChangelogGenerator:
@@ -124,8 +129,7 @@ class ChangelogGenerator:
             Tuple of (category, message)
         """
         # Check conventional commit format: type(scope): message
-        conv_pattern = r"^(\w+)(?:\([\w-]+\))?: (.+)$"
-        match = re.match(conv_pattern, commit)
+        match = CONVENTIONAL_COMMIT_PATTERN.match(commit)
         
         if match:
             commit_type = match.group(1).lower()
@@ -134,8 +138,7 @@ class ChangelogGenerator:
             return category, message
         
         # Check for manual category: [CATEGORY] message
-        manual_pattern = r"^\[(\w+)\] (.+)$"
-        match = re.match(manual_pattern, commit)
+        match = MANUAL_CATEGORY_PATTERN.match(commit)
         
         if match:
             category_name = match.group(1).capitalize()
@@ -143,19 +146,20 @@ class ChangelogGenerator:
             if category_name in CATEGORIES:
                 return category_name, message
         
-        # No category found, try to infer from keywords
-        for keyword, category in COMMIT_CATEGORIES.items():
-            if commit.lower().startswith(f"{keyword}:") or commit.lower().startswith(f"{keyword} "):
-                message = commit[len(keyword):].strip()
-                if message.startswith(":"):
-                    message = message[1:].strip()
-                return category, message
+        # No category found, try to infer from a leading "keyword:" or "keyword "
+        keyword = commit.lower().split(" ", 1)[0].split(":", 1)[0]
+        if keyword in COMMIT_CATEGORIES and len(commit) > len(keyword):
+            message = commit[len(keyword):].strip()
+            if message.startswith(":"):
+                message = message[1:].strip()
+            return COMMIT_CATEGORIES[keyword], message
         
         # Default to Changed category
         return "Changed", commit
     
     def generate_changelog_from_commits(
-        self, version: str, start_ref: Optional[str] = None, end_ref: str = "HEAD"
+        self, version: str, start_ref: Optional[str] = None, end_ref: str = "HEAD",
+        release_date: Optional[str] = None
     ) -> str:
         """Generate changelog content from Git commit history
         
@@ -163,6 +167,7 @@ class ChangelogGenerator:
             version: Version to use in the changelog
             start_ref: Starting Git reference
             end_ref: Ending Git reference
+            release_date: Date for the version heading, defaults to today
             
         Returns:
             Generated changelog content
@@ -178,8 +183,8 @@ class ChangelogGenerator:
                 categorized_commits[category].append(message)
         
         # Generate changelog content
-        today = datetime.now().strftime("%Y-%m-%d")
-        content = f"## [{version}] - {today}\n\n"
+        release_date = release_date or datetime.now().strftime("%Y-%m-%d")
+        content = f"## [{version}] - {release_date}\n\n"
         
         for category in CATEGORIES:
             commits = categorized_commits[category]
@@ -210,15 +215,15 @@ class ChangelogGenerator:
         # Read the existing changelog
         existing_content = ""
         try:
-            if os.path.exists(self.changelog_file):
-                with open(self.changelog_file, 'r') as f:
-                    existing_content = f.read()
+            with open(self.changelog_file, 'r') as f:
+                existing_content = f.read()
+        except FileNotFoundError:
+            pass
         except IOError as e:
             print(f"Warning: Could not read changelog file: {e}")
         
         # Initialize the changelog if it doesn't exist or is empty
         if not existing_content:
-            today = datetime.now().strftime("%Y-%m-%d")
             existing_content = (
                 "# Changelog\n\n"
                 "All notable changes to this project will be documented in this file.\n\n"
@@ -227,15 +232,13 @@ class ChangelogGenerator:
             )
         
         # Insert the new content after the header
-        header_pattern = r"(# Changelog.*?adheres to \[Semantic Versioning\].*?\n\n)"
-        match = re.search(header_pattern, existing_content, re.DOTALL)
+        match = CHANGELOG_HEADER_PATTERN.search(existing_content)
         
         if match:
-            updated_content = re.sub(
-                header_pattern,
-                f"{match.group(1)}{new_content}",
-                existing_content,
-                flags=re.DOTALL
+            header_end = match.end()
+            updated_content = (
+                f"{existing_content[:header_end]}{new_content}"
+                f"{existing_content[header_end:]}"
             )
         else:
             # If no header is found, just prepend the new content
@@ -303,16 +306,21 @@ class ChangelogGenerator:
         
         # Generate changelog content for each version
         content = ""
+        today = datetime.now().strftime("%Y-%m-%d")
         for i in range(end_idx, start_idx + 1):
             version_tag, _ = tags[i]
             version = version_tag[1:]  # Remove 'v' prefix
             
             if i < len(tags) - 1:
                 prev_tag, _ = tags[i + 1]
-                version_content = self.generate_changelog_from_commits(version, prev_tag, version_tag)
+                version_content = self.generate_changelog_from_commits(
+                    version, prev_tag, version_tag, release_date=today
+                )
             else:
                 # No previous tag, use all commits up to this tag
-                version_content = self.generate_changelog_from_commits(version, None, version_tag)
+                version_content = self.generate_changelog_from_commits(
+                    version, None, version_tag, release_date=today
+                )
             
             content += version_content + "\n"
         
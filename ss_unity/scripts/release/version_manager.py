@@ -18,6 +18,9 @@ from typing import Dict, List, Optional, Tuple
 # Constants
 VERSION_FILE = "version.json"
 DEFAULT_VERSION = "1.0.0"
+VERSION_PATTERN = re.compile(
+    r"^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?$"
+)
 
 
 class VersionType(Enum):
@@ -46,14 +49,13 @@ class VersionManager:
         Returns:
             Dict containing version information
         """
-        if os.path.exists(self.version_file_path):
-            try:
-                with open(self.version_file_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error reading version file: {e}")
-                return self._create_default_version_info()
-        else:
+        try:
+            with open(self.version_file_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return self._create_default_version_info()
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error reading version file: {e}")
             return self._create_default_version_info()
     
     def _create_default_version_info(self) -> Dict:
@@ -118,12 +120,13 @@ class VersionManager:
             The new version string
         """
         major, minor, patch, _, _ = self.get_version_parts()
+        now = datetime.now().isoformat()
         
         # Save the previous version in history
         prev_version = self.get_version()
         history_entry = {
             "version": prev_version,
-            "date": datetime.now().isoformat(),
+            "date": now,
             "message": commit_msg or f"Version bump: {version_type.value}"
         }
         self.version_info["history"].append(history_entry)
@@ -154,7 +157,7 @@ class VersionManager:
             version += f"+{build}"
         
         self.version_info["version"] = version
-        self.version_info["last_updated"] = datetime.now().isoformat()
+        self.version_info["last_updated"] = now
         
         # Save the updated version info
         self._save_version_info()
@@ -175,8 +178,7 @@ class VersionManager:
             ValueError: If the version string is invalid
         """
         # Validate and parse the version string
-        pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?$"
-        match = re.match(pattern, version_str)
+        match = VERSION_PATTERN.match(version_str)
         if not match:
             raise ValueError(f"Invalid version string: {version_str}")
         
@@ -185,12 +187,13 @@ class VersionManager:
         patch = int(match.group(3))
         pre_release = match.group(4)
         build = match.group(5)
+        now = datetime.now().isoformat()
         
         # Save the previous version in history
         prev_version = self.get_version()
         history_entry = {
             "version": prev_version,
-            "date": datetime.now().isoformat(),
+            "date": now,
             "message": commit_msg or f"Version set: {version_str}"
         }
         self.version_info["history"].append(history_entry)
@@ -202,7 +205,7 @@ class VersionManager:
         self.version_info["patch"] = patch
         self.version_info["pre_release"] = pre_release
         self.version_info["build"] = build
-        self.version_info["last_updated"] = datetime.now().isoformat()
+        self.version_info["last_updated"] = now
         
         # Save the updated version info
         self._save_version_info()